@@ -1,3 +1,18 @@
+import os
+
+# Threaded (gthread) workers: message processing already runs on the bot's own
+# thread pool, so request threads only verify + enqueue and return in ms.
+bind         = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+worker_class = "gthread"
+# Pinned to one process: the catalog, APScheduler and in-memory fallbacks are
+# per-process, and PaaS hosts set WEB_CONCURRENCY on their own — don't read it.
+workers      = 1
+threads      = int(os.environ.get("GUNICORN_THREADS", "8"))
+# Meta delivers webhooks over reused HTTPS connections; holding idle ones open
+# a little longer than the 2s default skips a reconnect per burst.
+keepalive    = int(os.environ.get("GUNICORN_KEEPALIVE", "5"))
+
+
 def post_fork(server, worker):
     """Start the webhook worker thread AFTER Gunicorn forks the worker process."""
     from messenger_bot_test import _startup